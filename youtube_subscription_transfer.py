@@ -19,15 +19,34 @@ import json
 import time
 import logging
 import argparse
-from datetime import datetime
-from typing import List, Dict, Optional
+import functools
+import itertools
+from datetime import datetime, timedelta
+from typing import List, Dict, Iterable, Iterator, Optional, Set
 
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+# orjson is optional; it serializes large subscription backups much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson is optional; it streams the backup file instead of loading it whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors raised while reading a (possibly truncated or missing) backup file
+BACKUP_READ_ERRORS = (OSError, ValueError) + ((ijson.JSONError,) if ijson is not None else ())
+
 # YouTube Data API v3 scopes
 SCOPES = ['https://www.googleapis.com/auth/youtube.readonly',
           'https://www.googleapis.com/auth/youtube']
@@ -39,9 +58,19 @@ API_VERSION = 'v3'
 # Configuration
 CREDENTIALS_FILE = 'credentials.json'
 SUBSCRIPTIONS_DATA_FILE = 'subscriptions_backup.json'
-PROGRESS_FILE = 'transfer_progress.json'
+PROGRESS_FILE = 'transfer_progress.ndjson'
+LEGACY_PROGRESS_FILE = 'transfer_progress.json'  # Written by older versions
 LOG_FILE = 'youtube_transfer.log'
 
+# Socket timeout in seconds for API requests
+HTTP_TIMEOUT = 30
+
+# fsync the progress log every this many entries
+PROGRESS_FSYNC_INTERVAL = 20
+
+# Maximum number of subscription inserts packed into one batch HTTP request
+BATCH_SIZE = 50
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -54,6 +83,126 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _dump_json(data) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _load_json(raw: bytes):
+    """Parse UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _subscription_body(channel_id: str) -> Dict:
+    """Build the subscriptions().insert request body for a channel."""
+    return {'snippet': {'resourceId': {'kind': 'youtube#channel', 'channelId': channel_id}}}
+
+
+def _error_reason(error: HttpError) -> str:
+    """Return the API error reason from an HttpError, or 'unknown'."""
+    error_details = error.error_details[0] if error.error_details else {}
+    return error_details.get('reason', 'unknown')
+
+
+# Handlers for failed subscription inserts, keyed by API error reason. Each takes
+# (error, channel_title) and returns (stats_key, throttle): the stats key to count
+# the insert under, or None to retry it in a later batch, and whether to slow the
+# rate limiter down.
+
+def _on_duplicate(error, channel_title):
+    """Count a duplicate subscription as already subscribed."""
+    logger.info(f"Already subscribed to: {channel_title}")
+    return 'already_subscribed', False
+
+
+def _on_channel_not_found(error, channel_title):
+    """Give up on channels that no longer exist."""
+    logger.warning(f"Channel not found: {channel_title}")
+    return 'failed', False
+
+
+def _on_quota_exceeded(error, channel_title):
+    """Give up once the daily quota is spent."""
+    logger.error("API quota exceeded. Please try again later.")
+    return 'failed', False
+
+
+def _on_rate_limit(error, channel_title):
+    """Retry rate-limited inserts in a later batch."""
+    logger.warning(f"Rate limit hit for {channel_title}")
+    return None, True
+
+
+def _on_other_error(error, channel_title):
+    """Retry any other error in a later batch."""
+    logger.warning(f"Error subscribing to {channel_title}: {_error_reason(error)}")
+    return None, False
+
+
+_REASON_ACTIONS = {
+    'subscriptionDuplicate': _on_duplicate,
+    'channelNotFound': _on_channel_not_found,
+    'quotaExceeded': _on_quota_exceeded,
+    'rateLimitExceeded': _on_rate_limit,
+    'userRateLimitExceeded': _on_rate_limit,
+}
+
+
+class TokenBucket:
+    """Token-bucket rate limiter for pacing API calls."""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens the bucket can hold
+        """
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._throttled_until = 0.0
+
+    def acquire(self, tokens: float = 1) -> None:
+        """
+        Take tokens from the bucket, sleeping only if not enough are available.
+
+        Args:
+            tokens: Number of tokens to take
+        """
+        now = time.monotonic()
+        if self._throttled_until and now >= self._throttled_until:
+            self.rate = self.base_rate
+            self._throttled_until = 0.0
+
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+        self._tokens -= tokens
+        if self._tokens < 0:
+            time.sleep(-self._tokens / self.rate)
+
+    def throttle(self, duration: float = 60.0) -> None:
+        """
+        Halve the rate for a while after the server reports a rate limit.
+
+        Repeated calls while already throttled only extend the throttle period.
+
+        Args:
+            duration: Seconds before the original rate is restored
+        """
+        if not self._throttled_until:
+            self.rate /= 2
+        self._throttled_until = time.monotonic() + duration
+
+
 class YouTubeSubscriptionTransfer:
     """Main class for handling YouTube subscription transfers."""
 
@@ -64,6 +213,24 @@ class YouTubeSubscriptionTransfer:
         self.resume_mode = resume_mode
         self.wait_time = wait_time
 
+        # One HTTP client for all API calls so keep-alive connections are reused
+        self._http = httplib2.Http(timeout=HTTP_TIMEOUT)
+
+        # Pace API calls at one per wait_time on average. Every insert in a batch
+        # counts as its own call; the capacity lets one full batch go out unpaced.
+        self._bucket = TokenBucket(rate=1 / wait_time, capacity=BATCH_SIZE) if wait_time > 0 else None
+
+        # Channel IDs the destination account is known to be subscribed to
+        self._dest_subscribed: Set[str] = set()
+
+        # Append-only progress log, opened on first save
+        self._progress_fp = None
+        self._progress_writes = 0
+
+        # Progress entries store seconds elapsed since this wall-clock start time
+        self._progress_t0 = time.monotonic()
+        self._progress_iso0 = datetime.now().isoformat()
+
     def authenticate(self, account_name: str) -> bool:
         """
         Authenticate with YouTube Data API using OAuth2.
@@ -102,15 +269,34 @@ class YouTubeSubscriptionTransfer:
                 logger.info(f"Completed OAuth flow for {account_name}")
 
             # Save credentials for future use
-            with open(token_file, 'w') as token:
-                token.write(creds.to_json())
-                logger.info(f"Saved credentials for {account_name}")
+            self._save_token(token_file, creds)
+            logger.info(f"Saved credentials for {account_name}")
 
         self.credentials = creds
-        self.youtube_service = build(API_SERVICE_NAME, API_VERSION, credentials=creds)
+        # Cached subscription state belongs to the previously authenticated account
+        self._dest_subscribed = set()
+        # Use the discovery document bundled with google-api-python-client so
+        # startup never fetches or parses it over the network
+        authed_http = google_auth_httplib2.AuthorizedHttp(creds, http=self._http)
+        self.youtube_service = build(API_SERVICE_NAME, API_VERSION, http=authed_http,
+                                     static_discovery=True, cache_discovery=False)
         logger.info(f"Successfully authenticated {account_name} account")
         return True
 
+    def _save_token(self, token_file: str, creds: Credentials) -> None:
+        """
+        Atomically write credentials to the token file.
+
+        Args:
+            token_file: Path of the token file
+            creds: Credentials to persist
+        """
+        # Write to a temp file and swap it in so a crash never leaves a truncated token
+        tmp_file = token_file + '.tmp'
+        with open(tmp_file, 'w') as token:
+            token.write(creds.to_json())
+        os.replace(tmp_file, token_file)
+
     def get_channel_info(self) -> Optional[Dict]:
         """
         Get information about the authenticated channel.
@@ -121,12 +307,15 @@ class YouTubeSubscriptionTransfer:
         try:
             request = self.youtube_service.channels().list(
                 part='snippet',
-                mine=True
+                mine=True,
+                fields='items(id,snippet(title,description,customUrl))'
             )
             response = request.execute()
 
-            if response['items']:
-                channel = response['items'][0]
+            # Partial responses omit 'items' entirely when there is no channel
+            items = response.get('items')
+            if items:
+                channel = items[0]
                 return {
                     'id': channel['id'],
                     'title': channel['snippet']['title'],
@@ -146,6 +335,7 @@ class YouTubeSubscriptionTransfer:
             List[Dict]: List of subscription data
         """
         subscriptions = []
+        append = subscriptions.append
         next_page_token = None
 
         logger.info("Starting subscription extraction...")
@@ -156,30 +346,29 @@ class YouTubeSubscriptionTransfer:
                     part='snippet',
                     mine=True,
                     maxResults=50,
-                    pageToken=next_page_token
+                    pageToken=next_page_token,
+                    fields='items(id,snippet(title,description,publishedAt,resourceId/channelId)),nextPageToken'
                 )
                 response = request.execute()
-
-                for item in response.get('items', []):
-                    subscription_data = {
-                        'channel_id': item['snippet']['resourceId']['channelId'],
-                        'channel_title': item['snippet']['title'],
-                        'channel_description': item['snippet'].get('description', ''),
-                        'published_at': item['snippet']['publishedAt'],
+                items = response.get('items', [])
+
+                for item in items:
+                    snippet = item['snippet']
+                    append({
+                        'channel_id': snippet['resourceId']['channelId'],
+                        'channel_title': snippet['title'],
+                        'channel_description': snippet.get('description', ''),
+                        'published_at': snippet['publishedAt'],
                         'subscription_id': item['id']
-                    }
-                    subscriptions.append(subscription_data)
+                    })
 
-                logger.info(f"Extracted {len(response.get('items', []))} subscriptions (Total: {len(subscriptions)})")
+                logger.info(f"Extracted {len(items)} subscriptions (Total: {len(subscriptions)})")
 
                 # Check if there are more pages
                 next_page_token = response.get('nextPageToken')
                 if not next_page_token:
                     break
 
-                # Add small delay to respect rate limits
-                time.sleep(min(0.1, self.wait_time))
-
             except HttpError as e:
                 logger.error(f"Error extracting subscriptions: {e}")
                 break
@@ -208,8 +397,9 @@ class YouTubeSubscriptionTransfer:
                 'subscriptions': subscriptions
             }
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2, ensure_ascii=False)
+            # Write the whole document through a 64KB buffer in a single call
+            with open(filename, 'wb', buffering=64 * 1024) as f:
+                f.write(_dump_json(backup_data))
 
             logger.info(f"Successfully saved {len(subscriptions)} subscriptions to {filename}")
             return True
@@ -232,8 +422,8 @@ class YouTubeSubscriptionTransfer:
             filename = SUBSCRIPTIONS_DATA_FILE
 
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filename, 'rb', buffering=64 * 1024) as f:
+                data = _load_json(f.read())
 
             subscriptions = data.get('subscriptions', [])
             logger.info(f"Successfully loaded {len(subscriptions)} subscriptions from {filename}")
@@ -243,145 +433,177 @@ class YouTubeSubscriptionTransfer:
             logger.error(f"Failed to load subscriptions: {e}")
             return []
 
-    def subscribe_to_channel(self, channel_id: str, channel_title: str, max_retries: int = 3) -> bool:
+    def iter_subscriptions(self, filename: str = None) -> Iterator[Dict]:
         """
-        Subscribe to a specific channel with retry logic.
+        Stream subscription data from JSON file one entry at a time.
+
+        Falls back to load_subscriptions when ijson is not installed.
 
         Args:
-            channel_id: YouTube channel ID
-            channel_title: Channel title for logging
-            max_retries: Maximum number of retry attempts
+            filename: Optional custom filename
 
-        Returns:
-            bool: True if successful
+        Yields:
+            Dict: Subscription data
         """
-        for attempt in range(max_retries):
-            try:
-                request_body = {
-                    'snippet': {
-                        'resourceId': {
-                            'kind': 'youtube#channel',
-                            'channelId': channel_id
-                        }
-                    }
-                }
+        if filename is None:
+            filename = SUBSCRIPTIONS_DATA_FILE
 
-                request = self.youtube_service.subscriptions().insert(
-                    part='snippet',
-                    body=request_body
-                )
-                response = request.execute()
+        if ijson is None:
+            yield from self.load_subscriptions(filename)
+            return
 
-                logger.info(f"Successfully subscribed to: {channel_title}")
-                return True
+        with open(filename, 'rb', buffering=64 * 1024) as f:
+            yield from ijson.items(f, 'subscriptions.item')
 
-            except HttpError as e:
-                error_details = e.error_details[0] if e.error_details else {}
-                reason = error_details.get('reason', 'unknown')
-
-                if reason == 'subscriptionDuplicate':
-                    logger.info(f"Already subscribed to: {channel_title}")
-                    return True
-                elif reason == 'channelNotFound':
-                    logger.warning(f"Channel not found: {channel_title}")
-                    return False  # Don't retry for missing channels
-                elif reason == 'quotaExceeded':
-                    logger.error("API quota exceeded. Please try again later.")
-                    return False  # Don't retry quota exceeded immediately
-                elif reason in ['rateLimitExceeded', 'userRateLimitExceeded']:
-                    if attempt < max_retries - 1:
-                        wait_time = (2 ** attempt) * 5  # Exponential backoff: 5s, 10s, 20s
-                        logger.warning(f"Rate limit hit for {channel_title}. Retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"Rate limit exceeded for {channel_title} after {max_retries} attempts")
-                        return False
-                else:
-                    if attempt < max_retries - 1:
-                        wait_time = (attempt + 1) * 2  # Linear backoff: 2s, 4s, 6s
-                        logger.warning(f"Error subscribing to {channel_title}: {reason}. Retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"Failed to subscribe to {channel_title} after {max_retries} attempts: {e}")
-
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    wait_time = (attempt + 1) * 2
-                    logger.warning(f"Unexpected error subscribing to {channel_title}: {e}. Retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    logger.error(f"Unexpected error subscribing to {channel_title} after {max_retries} attempts: {e}")
+    def count_subscriptions(self, filename: str = None) -> int:
+        """
+        Count the subscriptions in the JSON file without loading the list.
+
+        Streams the whole file when ijson is installed, so a truncated or
+        corrupt backup counts as 0 just like with load_subscriptions.
+
+        Args:
+            filename: Optional custom filename
+
+        Returns:
+            int: Number of subscriptions, or 0 if the file can't be read
+        """
+        if filename is None:
+            filename = SUBSCRIPTIONS_DATA_FILE
+
+        if ijson is None:
+            return len(self.load_subscriptions(filename))
+
+        try:
+            return sum(1 for _ in self.iter_subscriptions(filename))
 
-        return False
+        except Exception as e:
+            logger.error(f"Failed to count subscriptions: {e}")
+            return 0
 
-    def save_progress(self, index: int, channel_id: str, total: int) -> None:
+    def save_progress(self, index: int, channel_id: str) -> None:
         """
-        Save current progress to file.
+        Append current progress to the progress log.
 
         Args:
             index: Current subscription index
             channel_id: Current channel ID being processed
-            total: Total number of subscriptions
         """
         progress_data = {
-            'last_processed_index': index,
-            'last_channel_id': channel_id,
-            'total_subscriptions': total,
-            'timestamp': datetime.now().isoformat()
+            'i': index,
+            'id': channel_id,
+            'ts0': self._progress_iso0,
+            'elapsed_s': round(time.monotonic() - self._progress_t0, 2)
         }
 
         try:
-            with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(progress_data, f, indent=2)
+            if self._progress_fp is None:
+                self._progress_fp = open(PROGRESS_FILE, 'a', encoding='utf-8', buffering=8 * 1024)
+                if not self._ends_with_newline(PROGRESS_FILE):
+                    # Start on a fresh line after a torn entry from a previous crash
+                    self._progress_fp.write('\n')
+            self._progress_fp.write(json.dumps(progress_data, separators=(',', ':')) + '\n')
+            # Progress is saved once per batch, so every entry is worth keeping
+            self._progress_fp.flush()
+            self._progress_writes += 1
+            if self._progress_writes % PROGRESS_FSYNC_INTERVAL == 0:
+                os.fsync(self._progress_fp.fileno())
         except Exception as e:
             logger.warning(f"Failed to save progress: {e}")
 
+    @staticmethod
+    def _ends_with_newline(filename: str) -> bool:
+        """Return True if the file is empty or its last byte is a newline."""
+        with open(filename, 'rb') as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
     def load_progress(self) -> Dict:
         """
-        Load progress from file.
+        Load the most recent entry from the progress log.
+
+        Falls back to the single-object progress file written by older
+        versions, so an interrupted transfer can still be resumed.
 
         Returns:
             Dict: Progress data or empty dict if no progress found
         """
         try:
             if os.path.exists(PROGRESS_FILE):
-                with open(PROGRESS_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(PROGRESS_FILE, 'rb') as f:
+                    # Only the last line matters; read the tail instead of replaying the log
+                    size = f.seek(0, os.SEEK_END)
+                    f.seek(max(0, size - 4096))
+                    lines = f.read().splitlines()
+
+                # A crash mid-append can leave a torn last line; fall back to the one before it
+                for line in reversed(lines):
+                    try:
+                        entry = json.loads(line)
+                        return {
+                            'last_processed_index': entry['i'],
+                            'last_channel_id': entry['id'],
+                            'timestamp': (datetime.fromisoformat(entry['ts0'])
+                                          + timedelta(seconds=entry['elapsed_s'])).isoformat()
+                        }
+                    except (ValueError, TypeError, KeyError):
+                        continue
+
+            elif os.path.exists(LEGACY_PROGRESS_FILE):
+                with open(LEGACY_PROGRESS_FILE, 'r', encoding='utf-8') as f:
+                    progress = json.load(f)
+                logger.info(f"Using progress saved by an older version in {LEGACY_PROGRESS_FILE}")
+                # Older versions saved an index before processing it, so it may
+                # not have been subscribed yet; resume from that entry itself
+                progress['last_processed_index'] = progress.get('last_processed_index', 0) - 1
+                return progress
         except Exception as e:
             logger.warning(f"Failed to load progress: {e}")
 
         return {}
 
+    def _close_progress(self) -> None:
+        """
+        Close the progress log handle, keeping the file for a later resume.
+        """
+        if self._progress_fp is not None:
+            self._progress_fp.close()
+            self._progress_fp = None
+            self._progress_writes = 0
+
     def clear_progress(self) -> None:
         """
-        Clear the progress file.
+        Close and remove the progress log.
         """
         try:
-            if os.path.exists(PROGRESS_FILE):
-                os.remove(PROGRESS_FILE)
-                logger.info("Progress file cleared")
+            self._close_progress()
+            for progress_file in (PROGRESS_FILE, LEGACY_PROGRESS_FILE):
+                if os.path.exists(progress_file):
+                    os.remove(progress_file)
+                    logger.info(f"Progress file {progress_file} cleared")
         except Exception as e:
             logger.warning(f"Failed to clear progress: {e}")
 
-    def import_subscriptions(self, subscriptions: List[Dict]) -> Dict[str, int]:
+    def import_subscriptions(self, subscriptions: Iterable[Dict]) -> Dict[str, int]:
         """
         Subscribe to all channels from the subscription list.
 
         Args:
-            subscriptions: List of subscription data
+            subscriptions: Subscription data; any iterable, so the backup can be streamed
 
         Returns:
-            Dict: Statistics about the import process
+            Dict: Statistics about the import process; 'aborted' is 1 if the
+            subscription data could not be read to the end
         """
         stats = {
-            'total': len(subscriptions),
+            'total': 0,
             'successful': 0,
             'failed': 0,
             'already_subscribed': 0,
-            'skipped': 0
+            'skipped': 0,
+            'aborted': 0
         }
 
         # Load progress if in resume mode
@@ -398,41 +620,54 @@ class YouTubeSubscriptionTransfer:
             # Clear any existing progress if not in resume mode
             self.clear_progress()
 
-        logger.info(f"Starting import of {stats['total']} subscriptions (starting from index {start_index})...")
+        self._progress_t0 = time.monotonic()
+        self._progress_iso0 = datetime.now().isoformat()
 
-        for i, subscription in enumerate(subscriptions):
-            # Skip already processed subscriptions in resume mode
-            if i < start_index:
-                continue
+        # Fetch existing destination subscriptions once instead of probing per channel
+        self._dest_subscribed = self._load_dest_subscribed_ids()
 
-            channel_id = subscription['channel_id']
-            channel_title = subscription['channel_title']
+        logger.info(f"Starting import of subscriptions (starting from index {start_index})...")
 
-            logger.info(f"Processing {i+1}/{stats['total']}: {channel_title}")
+        stats['total'] = start_index
+        # Skipping happens in C, but streamed entries before start_index are still
+        # parsed, so resuming remains linear in start_index
+        pending = itertools.islice(subscriptions, start_index, None)
+        first_index = start_index
+        read_error = None
+        while read_error is None:
+            chunk = []
+            try:
+                for subscription in itertools.islice(pending, BATCH_SIZE):
+                    chunk.append(subscription)
+            except BACKUP_READ_ERRORS as e:
+                # Import what was read before a truncated or unreadable entry, then stop
+                read_error = e
 
-            # Save progress before processing
-            self.save_progress(i, channel_id, stats['total'])
+            if not chunk:
+                break
 
-            # Check if already subscribed first
-            if self.is_already_subscribed(channel_id):
-                stats['already_subscribed'] += 1
-                logger.info(f"Already subscribed to: {channel_title}")
-                continue
+            last_index = first_index + len(chunk) - 1
+            stats['total'] += len(chunk)
 
-            # Attempt to subscribe
-            if self.subscribe_to_channel(channel_id, channel_title):
-                stats['successful'] += 1
-            else:
-                stats['failed'] += 1
+            logger.info(f"Processing {first_index+1}-{last_index+1} "
+                        f"({len(chunk)} channels in one batch)")
+
+            # Subscribe to the whole chunk in a single HTTP round-trip
+            self._insert_with_retries(chunk, stats)
 
-            # Rate limiting - pause between requests
-            time.sleep(self.wait_time)
+            # Save progress once the whole batch has been processed
+            self.save_progress(last_index, chunk[-1]['channel_id'])
 
-            # Log progress every 10 subscriptions
-            processed = i + 1 - start_index
-            if processed % 10 == 0:
-                remaining = stats['total'] - (i + 1)
-                logger.info(f"Progress: {i+1}/{stats['total']} processed, {remaining} remaining")
+            logger.info(f"Progress: {last_index+1} processed")
+            first_index = last_index + 1
+
+        if read_error is not None:
+            # Keep the progress log so the import can be resumed once the backup is fixed
+            logger.error(f"Failed to read subscription data: {read_error}")
+            logger.error(f"Import stopped after {stats['total']} subscriptions; fix the backup file and resume")
+            self._close_progress()
+            stats['aborted'] = 1
+            return stats
 
         # Clear progress file on successful completion
         self.clear_progress()
@@ -443,21 +678,182 @@ class YouTubeSubscriptionTransfer:
 
         return stats
 
+    def _load_dest_subscribed_ids(self) -> Set[str]:
+        """
+        Fetch the channel IDs the authenticated account is already subscribed to.
+
+        Returns:
+            Set[str]: Subscribed channel IDs (possibly partial if the listing failed)
+        """
+        channel_ids = set()
+        next_page_token = None
+
+        while True:
+            try:
+                request = self.youtube_service.subscriptions().list(
+                    part='snippet',
+                    mine=True,
+                    maxResults=50,
+                    pageToken=next_page_token,
+                    fields='items/snippet/resourceId/channelId,nextPageToken'
+                )
+                response = request.execute()
+            except HttpError as e:
+                logger.warning(f"Failed to list existing subscriptions: {e}")
+                break
+
+            for item in response.get('items', []):
+                channel_ids.add(item['snippet']['resourceId']['channelId'])
+
+            next_page_token = response.get('nextPageToken')
+            if not next_page_token:
+                break
+
+        logger.info(f"Destination account already has {len(channel_ids)} subscriptions")
+        return channel_ids
+
+    def _insert_with_retries(self, chunk: List[Dict], stats: Dict[str, int], max_retries: int = 3) -> None:
+        """
+        Subscribe to a chunk of channels, re-batching transient failures with backoff.
+
+        Args:
+            chunk: List of subscription data (at most BATCH_SIZE entries)
+            stats: Import statistics, updated in place
+            max_retries: Maximum number of attempts per subscription
+        """
+        retry = self._insert_batch(chunk, stats)
+
+        for attempt in range(max_retries - 1):
+            if not retry:
+                return
+
+            wait_time = (2 ** attempt) * 5  # Exponential backoff: 5s, 10s, ...
+            logger.warning(f"{len(retry)} subscriptions hit transient errors. Retrying in {wait_time}s "
+                           f"(attempt {attempt + 1}/{max_retries})")
+            time.sleep(wait_time)
+            retry = self._insert_batch(retry, stats)
+
+        for subscription in retry:
+            stats['failed'] += 1
+            logger.error(f"Failed to subscribe to {subscription['channel_title']} after {max_retries} attempts")
+
+    def _insert_batch(self, chunk: List[Dict], stats: Dict[str, int]) -> List[Dict]:
+        """
+        Subscribe to a chunk of channels using a single batch HTTP request.
+
+        Args:
+            chunk: List of subscription data (at most BATCH_SIZE entries)
+            stats: Import statistics, updated in place
+
+        Returns:
+            List[Dict]: Subscriptions that failed with a transient error and should be retried
+        """
+        # Per-batch state, bound into the callback rather than stored on self
+        pending = {}
+        retry = []
+
+        batch = self.youtube_service.new_batch_http_request(
+            callback=functools.partial(self._on_insert, pending, stats, retry)
+        )
+        for subscription in chunk:
+            channel_id = subscription['channel_id']
+            if channel_id in self._dest_subscribed:
+                stats['already_subscribed'] += 1
+                logger.info(f"Already subscribed to: {subscription['channel_title']}")
+                continue
+            if channel_id in pending:
+                # Batch request IDs must be unique; the first copy's result covers this one
+                logger.info(f"Skipping repeated entry for: {subscription['channel_title']}")
+                continue
+
+            pending[channel_id] = subscription
+            batch.add(
+                self.youtube_service.subscriptions().insert(
+                    part='snippet',
+                    body=_subscription_body(channel_id)
+                ),
+                request_id=channel_id
+            )
+
+        if not pending:
+            return retry
+
+        # Rate limiting - take one token per insert before sending the batch
+        if self._bucket is not None:
+            self._bucket.acquire(len(pending))
+
+        try:
+            batch.execute()
+        except Exception as e:
+            # The batch itself failed; retry everything that didn't get a response
+            logger.warning(f"Batch request failed: {e}")
+            retry.extend(pending.values())
+
+        return retry
+
+    def _on_insert(self, pending: Dict[str, Dict], stats: Dict[str, int], retry: List[Dict],
+                   request_id: str, response: Optional[Dict], exception: Optional[Exception]) -> None:
+        """
+        Handle the result of a single subscription insert within a batch.
+
+        Args:
+            pending: Subscriptions of the batch still awaiting a response, keyed by channel ID
+            stats: Import statistics, updated in place
+            retry: Subscriptions to retry in a later batch, appended to in place
+            request_id: Channel ID the insert was issued for
+            response: API response, or None if the insert failed
+            exception: Error raised for the insert, or None if successful
+        """
+        subscription = pending.pop(request_id)
+        channel_title = subscription['channel_title']
+
+        if exception is None:
+            stats['successful'] += 1
+            self._dest_subscribed.add(request_id)
+            logger.info(f"Successfully subscribed to: {channel_title}")
+            return
+
+        if not isinstance(exception, HttpError):
+            logger.warning(f"Unexpected error subscribing to {channel_title}: {exception}")
+            retry.append(subscription)
+            return
+
+        handler = _REASON_ACTIONS.get(_error_reason(exception), _on_other_error)
+        outcome, throttle = handler(exception, channel_title)
+
+        if throttle and self._bucket is not None:
+            self._bucket.throttle()
+
+        if outcome is None:
+            retry.append(subscription)
+            return
+
+        stats[outcome] += 1
+        if outcome == 'already_subscribed':
+            self._dest_subscribed.add(request_id)
+
     def is_already_subscribed(self, channel_id: str) -> bool:
         """
         Check if already subscribed to a channel.
 
+        Channels already known from the destination subscriptions fetched
+        at the start of an import are answered without an API call.
+
         Args:
             channel_id: YouTube channel ID
 
         Returns:
             bool: True if already subscribed
         """
+        if channel_id in self._dest_subscribed:
+            return True
+
         try:
             request = self.youtube_service.subscriptions().list(
-                part='snippet',
+                part='id',
                 forChannelId=channel_id,
-                mine=True
+                mine=True,
+                fields='items/id'
             )
             response = request.execute()
             return len(response.get('items', [])) > 0
@@ -476,7 +872,8 @@ def main():
     parser.add_argument('--interactive', action='store_true', default=True,
                        help='Run in interactive mode (default)')
     parser.add_argument('--wait', type=float, default=0.5, metavar='SECONDS',
-                       help='Wait time in seconds between API calls (default: 0.5)')
+                       help='Average wait time in seconds between API calls; each subscription '
+                            'in a batch counts as one call (default: 0.5)')
     args = parser.parse_args()
 
     # Validate wait time
@@ -545,13 +942,13 @@ def main():
             # Import subscriptions
             print("\n--- Importing Subscriptions ---")
 
-            # Load subscription data
-            subscriptions = transfer_tool.load_subscriptions()
-            if not subscriptions:
+            # Count subscription data; the import itself streams the backup
+            total = transfer_tool.count_subscriptions()
+            if not total:
                 print("No subscription data found. Please extract subscriptions first.")
                 continue
 
-            print(f"Found {len(subscriptions)} subscriptions to import")
+            print(f"Found {total} subscriptions to import")
             print("You'll be prompted to authenticate with your DESTINATION account")
             input("Press Enter to continue...")
 
@@ -560,10 +957,13 @@ def main():
                 if channel_info:
                     print(f"Authenticated as: {channel_info['title']}")
 
-                confirm = input(f"\nProceed to subscribe to {len(subscriptions)} channels? (y/n): ")
+                confirm = input(f"\nProceed to subscribe to {total} channels? (y/n): ")
                 if confirm.lower() == 'y':
-                    stats = transfer_tool.import_subscriptions(subscriptions)
-                    print(f"\nImport completed!")
+                    stats = transfer_tool.import_subscriptions(transfer_tool.iter_subscriptions())
+                    if stats['aborted']:
+                        print("\nImport stopped early: the subscription data could not be read. See the log.")
+                    else:
+                        print(f"\nImport completed!")
                     print(f"Successful: {stats['successful']}")
                     print(f"Already subscribed: {stats['already_subscribed']}")
                     print(f"Failed: {stats['failed']}")
@@ -577,17 +977,17 @@ def main():
             print("\n--- Resuming Previous Import ---")
             transfer_tool.resume_mode = True
 
-            # Load subscription data
-            subscriptions = transfer_tool.load_subscriptions()
-            if not subscriptions:
+            # Count subscription data; the import itself streams the backup
+            total = transfer_tool.count_subscriptions()
+            if not total:
                 print("No subscription data found. Please extract subscriptions first.")
                 continue
 
             progress = existing_progress
             last_index = progress.get('last_processed_index', -1)
-            remaining = len(subscriptions) - (last_index + 1)
+            remaining = total - (last_index + 1)
 
-            print(f"Found {len(subscriptions)} total subscriptions")
+            print(f"Found {total} total subscriptions")
             print(f"Last processed: {progress.get('last_channel_id', 'unknown')} (index {last_index})")
             print(f"Remaining to process: {remaining}")
             print("You'll be prompted to authenticate with your DESTINATION account")
@@ -600,8 +1000,11 @@ def main():
 
                 confirm = input(f"\nProceed to resume importing {remaining} remaining channels? (y/n): ")
                 if confirm.lower() == 'y':
-                    stats = transfer_tool.import_subscriptions(subscriptions)
-                    print(f"\nImport completed!")
+                    stats = transfer_tool.import_subscriptions(transfer_tool.iter_subscriptions())
+                    if stats['aborted']:
+                        print("\nImport stopped early: the subscription data could not be read. See the log.")
+                    else:
+                        print(f"\nImport completed!")
                     print(f"Successful: {stats['successful']}")
                     print(f"Already subscribed: {stats['already_subscribed']}")
                     print(f"Failed: {stats['failed']}")